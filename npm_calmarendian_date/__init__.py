@@ -1,2 +1,3 @@
 from .calmarendian_date import CalmarendianDate
+from .calmarendian_date_array import CalmarendianDateArray
 from .time_delta import CalmarendianTimeDelta
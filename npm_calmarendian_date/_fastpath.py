@@ -0,0 +1,34 @@
+"""
+Integer Fast Path
+
+Pure integer implementations of the arithmetic at the heart of CalmarendianDate. These functions deal only in
+plain ints: they perform no validation and create no date element objects, leaving it to the caller to wrap the
+results once the arithmetic is complete.
+"""
+
+from bisect import bisect_right
+from typing import Tuple
+
+from npm_calmarendian_date.c_date_config import CDateConfig
+
+
+def decompose_adr(adr: int) -> Tuple[int, int, int, int, int]:
+    """
+    Return the five numeric Grand Cycle Notation elements (grand cycle, cycle, season, week, day)
+    of the given absolute day reference.
+
+    :param adr: An absolute day reference which is assumed to be within the valid date range.
+    :return: A five-tuple of GCN date elements.
+    """
+    grand_cycle, residue = divmod(adr - 1, CDateConfig.DAYS_per_GRAND_CYCLE)
+
+    cycle = bisect_right(CDateConfig.CYCLE_DAYS_PRIOR, residue)
+    residue -= CDateConfig.CYCLE_DAYS_PRIOR[cycle - 1]
+
+    season = bisect_right(CDateConfig.SEASON_DAYS_PRIOR, residue)
+    residue -= CDateConfig.SEASON_DAYS_PRIOR[season - 1]
+
+    week = bisect_right(CDateConfig.WEEK_DAYS_PRIOR, residue)
+    residue -= CDateConfig.WEEK_DAYS_PRIOR[week - 1]
+
+    return grand_cycle + 1, cycle, season, week, residue + 1
@@ -1,4 +1,5 @@
 import re
+from typing import Tuple
 
 
 class CDateConfig(object):
@@ -14,11 +15,16 @@ class CDateConfig(object):
 
     # Scale Factors
     DAYS_per_GRAND_CYCLE: int = 1_718_101
-    DAYS_per_CYCLE: float = DAYS_per_GRAND_CYCLE / 700
 
-    # Regex representation of Grand Cycle and Common symbolic Notations
-    GCN_DATE_STRING_RE = re.compile(r'^(\d{2})-([0-7]\d{2})-([1-7])-([0-5]\d)-([1-8])$')
-    CSN_DATE_STRING_RE = re.compile(r'^([1-9]?\d{3})-([1-7])-([0-5]\d)-([1-8]) *(BZ|BH|CE)?$', re.IGNORECASE)
+    # Cumulative day counts prior to the start of each cycle in a grand cycle, each season in a cycle
+    # and each week in a season. Element n (zero-based) is the days_prior() value of cycle, season or week n + 1.
+    CYCLE_DAYS_PRIOR: Tuple[int, ...] = tuple(k * 2454 + (k // 7) * 3 for k in range(700))
+    SEASON_DAYS_PRIOR: Tuple[int, ...] = tuple(k * 350 for k in range(7))
+    WEEK_DAYS_PRIOR: Tuple[int, ...] = tuple(k * 7 for k in range(51))
+
+    # Regex representation of Grand Cycle and Common symbolic Notations (unanchored: use with fullmatch)
+    GCN_DATE_STRING_RE = re.compile(r'(\d{2})-([0-7]\d{2})-([1-7])-([0-5]\d)-([1-8])')
+    CSN_DATE_STRING_RE = re.compile(r'([1-9]?\d{3})-([1-7])-([0-5]\d)-([1-8]) *(BZ|BH|CE)?', re.IGNORECASE)
 
     # Epoch for Apocalypse Reckoning (Day Zero (AR 0)) is 777-7-02-7.
     # Note that Day One of the Apocalypse (AR 1),
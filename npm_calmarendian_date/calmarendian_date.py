@@ -1,8 +1,8 @@
+from bisect import bisect_right
 from enum import Enum
-from functools import total_ordering
-from math import floor
-from typing import Tuple, Optional
+from typing import Iterable, List, Optional, Tuple
 
+from npm_calmarendian_date._fastpath import decompose_adr
 from npm_calmarendian_date.c_date_config import CDateConfig
 from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day
 from npm_calmarendian_date.exceptions import CalmarendianDateError, CalmarendianDateDomainError
@@ -15,12 +15,37 @@ class EraMarker(Enum):
     CE = "Current Era"
 
 
+# Era markers in chronological order, together with their abbreviated and verbose forms
+# as plain strings, all indexed by the era indices _BZ, _BH and _CE.
+_BZ, _BH, _CE = range(3)
+_ERA_MARKERS: Tuple[EraMarker, ...] = (EraMarker.BZ, EraMarker.BH, EraMarker.CE)
+_ERA_NAMES: Tuple[str, ...] = tuple(em.name for em in _ERA_MARKERS)
+_ERA_VALUES: Tuple[str, ...] = tuple(em.value for em in _ERA_MARKERS)
+
+# Zero-padded two- and three-digit renderings of the numbers used in GCN and CSN date strings, indexed by number.
+_PADDED_2: Tuple[str, ...] = tuple(f"{n:02}" for n in range(100))
+_PADDED_3: Tuple[str, ...] = tuple(f"{n:03}" for n in range(701))
+
+
 class DayRefDescriptor(Enum):
     ADR = "Absolute Day Reference"
     ARR = "Apocalypse Reckoning Reference"
 
 
-@total_ordering
+# Shared date element objects, one for every valid element value, indexed by element number (less one, except for
+# grand cycles). Weeks are indexed by [season - 1][week - 1], days by [week == 51][day - 1].
+_GRAND_CYCLES: Tuple[GrandCycle, ...] = tuple(GrandCycle(gc) for gc in range(100))
+_CYCLES: Tuple[CycleInGrandCycle, ...] = tuple(CycleInGrandCycle(c) for c in range(1, 701))
+_SEASONS: Tuple[Season, ...] = tuple(Season(s) for s in range(1, 8))
+_WEEKS: Tuple[Tuple[Week, ...], ...] = tuple(
+    tuple(Week(w, season) for w in range(1, season.max_weeks() + 1)) for season in _SEASONS
+)
+_DAYS: Tuple[Tuple[Day, ...], ...] = (
+    tuple(Day(d, _WEEKS[0][0], _CYCLES[0]) for d in range(1, 8)),
+    tuple(Day(d, _WEEKS[6][50], _CYCLES[699]) for d in range(1, 9)),
+)
+
+
 class CalmarendianDate(object):
     """
     The CalmarendianDate class is to the Calendar of Lorelei what, in Python terms, date is to Earth's Gregorian
@@ -28,6 +53,8 @@ class CalmarendianDate(object):
     (and always will be) in effect even though it demonstrably was not.
     """
 
+    __slots__ = ('_absolute_day_reference', 'grand_cycle', 'cycle', 'season', 'week', 'day', '_acr', '_render_cache')
+
     def __init__(self, new_adr: int):
         self.adr = new_adr
 
@@ -45,8 +72,18 @@ class CalmarendianDate(object):
         :param new_value: The sanitized_integer method will raise an error on any value that cannot be
         converted to an integer and for any value outside the valid date range.
         """
-        self._absolute_day_reference = self.sanitized_adr(new_value, DayRefDescriptor.ADR)
+        self._set_adr_unchecked(self.sanitized_adr(new_value, DayRefDescriptor.ADR))
+
+    def _set_adr_unchecked(self, new_value: int):
+        """
+        Set a new absolute day reference, and the date elements derived from it, without sanitizing it first.
+        For internal use only, where the value is already known to be an in-range integer.
+        :param new_value: A valid absolute day reference.
+        """
+        self._absolute_day_reference = new_value
         self.grand_cycle, self.cycle, self.season, self.week, self.day = self.elements_from_adr()
+        self._acr = None
+        self._render_cache = None
 
     @property
     def apocalypse_reckoning(self) -> int:
@@ -61,7 +98,19 @@ class CalmarendianDate(object):
         Set a new value for the absolute day reference based upon a day number in Apocalypse Reckoning.
         :param new_value: An integer apocalypse reckoning day number which should map to a valid CalmarendianDate.
         """
-        self.adr = self.sanitized_adr(new_value, DayRefDescriptor.ARR)
+        self._set_adr_unchecked(self.sanitized_adr(new_value, DayRefDescriptor.ARR))
+
+    @classmethod
+    def _from_adr_unchecked(cls, adr: int):
+        """
+        Create a CalmarendianDate object from an absolute day reference without sanitizing it first.
+        For internal use only, where the value is already known to be an in-range integer.
+        :param adr: A valid absolute day reference.
+        :return: A CalmarendianDate object.
+        """
+        date = cls.__new__(cls)
+        date._set_adr_unchecked(adr)
+        return date
 
     @classmethod
     def from_objects(
@@ -81,15 +130,15 @@ class CalmarendianDate(object):
         :param day:
         :return: A CalmarendianDate object.
         """
-        date = cls.__new__(cls)
-        date.adr = sum([
-            grand_cycle.days_prior(),
-            cycle.days_prior(),
-            season.days_prior(),
-            week.days_prior(),
-            day.number
-        ])
-        return date
+        # Validated date elements always sum to an in-range ADR, but the validators accept int-like numbers
+        # (floats, for example) so the sum must still be converted to an integer.
+        return cls._from_adr_unchecked(int(
+            grand_cycle.days_prior()
+            + cycle.days_prior()
+            + season.days_prior()
+            + week.days_prior()
+            + day.number
+        ))
 
     @classmethod
     def from_numbers(cls, gc: int, c: int, s: int, w: int, d: int):
@@ -133,7 +182,7 @@ class CalmarendianDate(object):
 
         :return: A CalmarendianDate object
         """
-        return cls(cls.sanitized_adr(apocalypse_day, DayRefDescriptor.ARR))
+        return cls._from_adr_unchecked(cls.sanitized_adr(apocalypse_day, DayRefDescriptor.ARR))
 
     @classmethod
     def today(cls):
@@ -149,6 +198,17 @@ class CalmarendianDate(object):
         """
         return cls.from_apocalypse_reckoning(1)
 
+    @classmethod
+    def decompose_many(cls, adrs: Iterable[int]) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Return the numeric Grand Cycle Notation elements for each of the given absolute day references
+        without creating a CalmarendianDate object (or any date element objects) for any of them.
+        :param adrs: An iterable of absolute day references, each of which is sanitized exactly as it would be
+        by the default constructor.
+        :return: A list of (grand_cycle, cycle, season, week, day) five-tuples, in the same order as the input.
+        """
+        return [decompose_adr(cls.sanitized_adr(adr, DayRefDescriptor.ADR)) for adr in adrs]
+
     @staticmethod
     def sanitized_adr(value: int, desc: DayRefDescriptor) -> int:
         """
@@ -180,60 +240,39 @@ class CalmarendianDate(object):
         :param days: A residual number of days, after accounting for the grand-cycle count.
         :return: The cycle number in which the given day falls.
         """
-        cycle = floor(days / CDateConfig.DAYS_per_CYCLE)
-        while cycle < 700 and CycleInGrandCycle(cycle + 1).days_prior() < days:
-            cycle += 1
-        return cycle
+        return bisect_right(CDateConfig.CYCLE_DAYS_PRIOR, days - 1)
 
     def elements_from_adr(self) -> Tuple[GrandCycle, CycleInGrandCycle, Season, Week, Day]:
         """
         Return a CalmarendianDate object's five grand cycle notation elements, as date element objects,
         calculated from the date's absolute day reference (ADR) property.
+        The element objects are immutable and are shared between all dates.
         """
-        residue = self.adr
-
-        # Calculate GRAND_CYCLE
-        grand_cycle = GrandCycle(floor((residue - 1) / CDateConfig.DAYS_per_GRAND_CYCLE) + 1)
-
-        # Re-calculate residual days
-        residue -= (grand_cycle.number - 1) * CDateConfig.DAYS_per_GRAND_CYCLE
-
-        # Calculate CYCLE
-        cycle = CycleInGrandCycle(self.cycle_decode(residue))
-
-        # Re-calculate residual days
-        residue -= (cycle.days_prior())
-
-        # Calculate SEASON
-        season = Season(min(floor((residue - 1) / 350) + 1, 7))
-
-        # Re-calculate residual days
-        residue -= season.days_prior()
-
-        # Calculate WEEK
-        week = Week(min(floor((residue - 1) / 7) + 1, 51), season)
-
-        # Re-calculate residual days
-        residue -= week.days_prior()
-
-        # Calculate DAY
-        day = Day(residue, week, cycle)
-
-        return grand_cycle, cycle, season, week, day
+        gc, c, s, w, d = decompose_adr(self._absolute_day_reference)
+        return _GRAND_CYCLES[gc], _CYCLES[c - 1], _SEASONS[s - 1], _WEEKS[s - 1][w - 1], _DAYS[w == 51][d - 1]
 
     def absolute_cycle_ref(self) -> Tuple[int, EraMarker]:
         """
         Return the cycle element of the date as a (cycle, era_marker) pair where cycle is the total number of cycles
         before or after Cycle Zero annotated with the appropriate ere marker BZ, BH or CE.
         """
-        acr = abs(((self.grand_cycle.number - 1) * 700) + self.cycle.number)
-        if self.grand_cycle.number <= 0:
-            em = EraMarker.BZ
-        elif 1 <= acr <= 500:
-            em = EraMarker.BH
-        else:
-            em = EraMarker.CE
-        return acr, em
+        acr, era = self._cycle_ref()
+        return acr, _ERA_MARKERS[era]
+
+    def _cycle_ref(self) -> Tuple[int, int]:
+        """
+        Return the absolute cycle reference as an (acr, era) pair of integers where era is an index into
+        _ERA_MARKERS, _ERA_NAMES and _ERA_VALUES.
+        The result is cached on first use and discarded whenever the date's ADR is changed.
+        """
+        if self._acr is not None:
+            return self._acr
+        gc = self.grand_cycle.number
+        acr = abs(((gc - 1) * 700) + self.cycle.number)
+        # Era index: _BZ for grand cycle 0; otherwise _BH up to cycle 500, _CE thereafter.
+        after_time_zero = gc > 0
+        self._acr = acr, after_time_zero + (after_time_zero and acr > 500)
+        return self._acr
 
     def absolute_season_ref(self) -> int:
         """
@@ -241,22 +280,19 @@ class CalmarendianDate(object):
         before or after Season 7 of Cycle Zero. Here we are happy for seasons Before Time Zero
         to be represented by negative numbers.
         """
-        return sum([
-            self.grand_cycle.seasons_prior(),
-            self.cycle.seasons_prior(),
-            self.season.number
-        ])
+        return (
+            self.grand_cycle.seasons_prior()
+            + self.cycle.seasons_prior()
+            + self.season.number
+        )
 
     def grand_cycle_notation(self) -> str:
         """
         Return the date as a Grand Cycle Notation date string.
         """
-        return "{:>02}-{:>03}-{}-{:>02}-{}".format(
-            self.grand_cycle.number,
-            self.cycle.number,
-            self.season.number,
-            self.week.number,
-            self.day.number
+        return (
+            f"{_PADDED_2[self.grand_cycle.number]}-{_PADDED_3[self.cycle.number]}-{self.season.number}-"
+            f"{_PADDED_2[self.week.number]}-{self.day.number}"
         )
 
     def common_symbolic_notation(self, era_marker: Optional[str] = None) -> str:
@@ -267,14 +303,11 @@ class CalmarendianDate(object):
         If 'CE' is specified, append an era marker to all dates.
         :return: CSN date string.
         """
-        acr, em = self.absolute_cycle_ref()
-        if isinstance(era_marker, str):
-            era_marker = era_marker.upper()
-        if era_marker == "CE" or (era_marker == "BH" and em == EraMarker.BH) or em == EraMarker.BZ:
-            era_marker = f" {em.name}"
-        else:
-            era_marker = ""
-        return f"{acr:>03}-{self.season.number}-{self.week.number:>02}-{self.day.number}{era_marker}"
+        acr, era = self._cycle_ref()
+        era_suffix = self._era_suffix(era, era_marker)
+        # Absolute cycle references beyond 700 are already at least three digits long and need no padding.
+        acr_string = _PADDED_3[acr] if acr <= 700 else acr
+        return f"{acr_string}-{self.season.number}-{_PADDED_2[self.week.number]}-{self.day.number}{era_suffix}"
 
     def colloquial_date(self, *,
                         era_marker: Optional[str] = None,
@@ -282,6 +315,7 @@ class CalmarendianDate(object):
                         ) -> str:
         """
         Return the date as a colloquial date string (for example: Monday, Week 7 of Onset 777).
+        Rendered strings are cached, per combination of arguments, until the date's ADR is changed.
         :param era_marker: A keyword-only argument whether 'CE' and/or 'BH' era markers should be
         explicitly included as part of the return string.
         :param verbose: A keyword-only argument which, if True, will cause the separator between the day-of-the-week
@@ -289,19 +323,42 @@ class CalmarendianDate(object):
         rather than a two letter abbreviation.
         :return: A colloquial date string.
         """
-        first_separator = " of" if verbose else ","
-        acr, em = self.absolute_cycle_ref()
-        if isinstance(era_marker, str):
-            era_marker = era_marker.upper()
-        if era_marker == "CE" or (era_marker == "BH" and em == EraMarker.BH) or em == EraMarker.BZ:
-            era_marker = f" {em.value}" if verbose else f" {em.name}"
-        else:
-            era_marker = ""
+        era_marker = era_marker.upper() if isinstance(era_marker, str) else None
+        key = (era_marker, bool(verbose))
+        if self._render_cache is None:
+            self._render_cache = {}
+        elif key in self._render_cache:
+            return self._render_cache[key]
+
+        acr, era = self._cycle_ref()
+        era_suffix = self._era_suffix(era, era_marker, verbose)
         if self.day.festival:
             if verbose:
-                return f"{self.day.name()} of {acr}{era_marker}"
-            return f"Festival {self.day.number} of {acr}{era_marker}"
-        return f"{self.day.name()}{first_separator} Week {self.week.number} of {self.season.name()} {acr}{era_marker}"
+                date_string = f"{self.day.name()} of {acr}{era_suffix}"
+            else:
+                date_string = f"Festival {self.day.number} of {acr}{era_suffix}"
+        else:
+            first_separator = " of" if verbose else ","
+            date_string = (
+                f"{self.day.name()}{first_separator} Week {self.week.number} of {self.season.name()} {acr}{era_suffix}"
+            )
+        self._render_cache[key] = date_string
+        return date_string
+
+    @staticmethod
+    def _era_suffix(era: int, era_marker: Optional[str], verbose: bool = False) -> str:
+        """
+        Return the era marker to append to a rendered date, complete with its leading space, or an empty string.
+        :param era: The date's era index, as returned by _cycle_ref.
+        :param era_marker: 'CE' to mark dates in all eras, 'BH' to mark dates before the Current Era;
+        otherwise (including None) only dates Before Time Zero are marked. Not case-sensitive.
+        :param verbose: If True, use the era's full name rather than its two letter abbreviation.
+        """
+        if isinstance(era_marker, str):
+            era_marker = era_marker.upper()
+        if era_marker == "CE" or (era_marker == "BH" and era == _BH) or era == _BZ:
+            return f" {_ERA_VALUES[era]}" if verbose else f" {_ERA_NAMES[era]}"
+        return ""
 
     def gcn(self) -> str:
         return self.grand_cycle_notation()
@@ -314,12 +371,39 @@ class CalmarendianDate(object):
     def __eq__(self, other) -> bool:
         if not isinstance(other, CalmarendianDate):
             return NotImplemented
-        return self.adr == other.adr
+        return self._absolute_day_reference == other._absolute_day_reference
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference != other._absolute_day_reference
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, CalmarendianDate):
             return NotImplemented
-        return self.adr < other.adr
+        return self._absolute_day_reference < other._absolute_day_reference
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference <= other._absolute_day_reference
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference > other._absolute_day_reference
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDate):
+            return NotImplemented
+        return self._absolute_day_reference >= other._absolute_day_reference
+
+    def __hash__(self) -> int:
+        """
+        Dates hash by their absolute day reference so that equal dates share a hash value.
+        Do not change the ADR of a date whilst it is being used as a set member or dictionary key.
+        """
+        return hash(self._absolute_day_reference)
 
     # -- str and repr -- #
 
@@ -0,0 +1,100 @@
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from npm_calmarendian_date._fastpath import decompose_adr
+from npm_calmarendian_date.calmarendian_date import CalmarendianDate, DayRefDescriptor
+
+
+class CalmarendianDateArray(object):
+    """
+    A compact, sequence-like container of Calmarendian dates which stores only each date's absolute day reference,
+    as a machine integer, rather than a full CalmarendianDate object (with its date elements) per date.
+    CalmarendianDate objects are created only when individual items are accessed.
+    """
+
+    __slots__ = ('_adrs',)
+
+    def __init__(self, adrs: Iterable[int] = ()):
+        """
+        Create a new date array from absolute day references.
+        :param adrs: An iterable of absolute day references, each of which is sanitized exactly as it would be
+        by the CalmarendianDate default constructor.
+        """
+        self._adrs = array('q', (CalmarendianDate.sanitized_adr(adr, DayRefDescriptor.ADR) for adr in adrs))
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[CalmarendianDate]):
+        """
+        Create a new date array from CalmarendianDate objects.
+        :param dates: An iterable of CalmarendianDate objects.
+        :return: A CalmarendianDateArray object.
+        """
+        return cls._from_array(array('q', (date.adr for date in dates)))
+
+    @classmethod
+    def _from_array(cls, adrs: array):
+        """
+        Wrap an array of absolute day references which are already known to be valid, without copying it.
+        """
+        date_array = cls.__new__(cls)
+        date_array._adrs = adrs
+        return date_array
+
+    @property
+    def adrs(self) -> array:
+        """
+        Return a copy of the underlying array of absolute day references.
+        """
+        return array('q', self._adrs)
+
+    def decompose(self) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Return the numeric Grand Cycle Notation elements of every date in the array
+        without creating any CalmarendianDate objects.
+        :return: A list of (grand_cycle, cycle, season, week, day) five-tuples.
+        """
+        return [decompose_adr(adr) for adr in self._adrs]
+
+    def min(self) -> CalmarendianDate:
+        """
+        Return the earliest date in the array. Raises ValueError if the array is empty.
+        """
+        return CalmarendianDate._from_adr_unchecked(min(self._adrs))
+
+    def max(self) -> CalmarendianDate:
+        """
+        Return the latest date in the array. Raises ValueError if the array is empty.
+        """
+        return CalmarendianDate._from_adr_unchecked(max(self._adrs))
+
+    def sorted(self, *, reverse: bool = False):
+        """
+        Return a new date array holding the same dates in chronological order (or reverse chronological order).
+        """
+        return self._from_array(array('q', sorted(self._adrs, reverse=reverse)))
+
+    # -- SEQUENCE PROTOCOL -- #
+
+    def __len__(self) -> int:
+        return len(self._adrs)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._from_array(self._adrs[index])
+        return CalmarendianDate._from_adr_unchecked(self._adrs[index])
+
+    def __iter__(self) -> Iterator[CalmarendianDate]:
+        return (CalmarendianDate._from_adr_unchecked(adr) for adr in self._adrs)
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, CalmarendianDate):
+            return False
+        return date.adr in self._adrs
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CalmarendianDateArray):
+            return NotImplemented
+        return self._adrs == other._adrs
+
+    def __repr__(self) -> str:
+        return f"CalmarendianDateArray({self._adrs.tolist()})"
@@ -9,7 +9,6 @@ There are, therefore, separate classes for each of these elements, and it is ins
 CalmarendianDate uses, rather than the raw integer values.
 """
 
-from math import floor
 from typing import List, NamedTuple
 
 from npm_calmarendian_date.c_date_config import CDateConfig
@@ -26,8 +25,17 @@ class GrandCycle(object):
     Grand Cycle 1, by definition, began on Monday, Week 1 of Winter 1 BH.
     """
 
+    __slots__ = ('_number',)
+
     def __init__(self, grand_cycle: int):
-        self.number = self.verified_grand_cycle_number(grand_cycle)
+        self._number = self.verified_grand_cycle_number(grand_cycle)
+
+    @property
+    def number(self) -> int:
+        """
+        Return the grand cycle number (read-only).
+        """
+        return self._number
 
     @staticmethod
     def verified_grand_cycle_number(grand_cycle: int) -> int:
@@ -82,8 +90,17 @@ class CycleInGrandCycle(object):
     Calendar of Lorelei.
     """
 
+    __slots__ = ('_number',)
+
     def __init__(self, cycle: int):
-        self.number = self.verified_cycle_in_grand_cycle_number(cycle)
+        self._number = self.verified_cycle_in_grand_cycle_number(cycle)
+
+    @property
+    def number(self) -> int:
+        """
+        Return the cycle_in_grand_cycle number (read-only).
+        """
+        return self._number
 
     @staticmethod
     def verified_cycle_in_grand_cycle_number(cycle: int) -> int:
@@ -125,7 +142,7 @@ class CycleInGrandCycle(object):
         The eighth festival day every seven-hundredth cycle is accounted for in CDateConfig.DAYS_per_GRAND_CYCLE
         """
         cycles_prior = self.number - 1
-        return cycles_prior * 2454 + floor(cycles_prior / 7) * 3
+        return cycles_prior * 2454 + (cycles_prior // 7) * 3
 
     def seasons_prior(self) -> int:
         """
@@ -148,8 +165,17 @@ class Season(object):
         "Midwinter", "Thaw", "Spring", "Perihelion", "High Summer", "Autumn", "Onset"
     ]
 
+    __slots__ = ('_number',)
+
     def __init__(self, season: int):
-        self.number = self.verified_season(season)
+        self._number = self.verified_season(season)
+
+    @property
+    def number(self) -> int:
+        """
+        Return the season number (read-only).
+        """
+        return self._number
 
     @staticmethod
     def verified_season(season: int) -> int:
@@ -259,10 +285,33 @@ class Week(object):
         'Festival'
     ]
 
+    __slots__ = ('_number', '_season', '_weekend')
+
     def __init__(self, week: int, season: Season):
-        self.number = self.verified_week(week, season)
-        self.season = season
-        self.weekend = self.weekend_data()
+        self._number = self.verified_week(week, season)
+        self._season = season
+        self._weekend = self.weekend_data()
+
+    @property
+    def number(self) -> int:
+        """
+        Return the week number (read-only).
+        """
+        return self._number
+
+    @property
+    def season(self) -> Season:
+        """
+        Return the season to which the week belongs (read-only).
+        """
+        return self._season
+
+    @property
+    def weekend(self) -> Weekend:
+        """
+        Return the week's weekend data (read-only).
+        """
+        return self._weekend
 
     @staticmethod
     def verified_week(week: int, season: Season) -> int:
@@ -320,9 +369,25 @@ class Day(object):
     DAY_NAMES: List[str] = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     LONG_NUMBERS: List[str] = ["One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight"]
 
+    __slots__ = ('_number', '_festival')
+
     def __init__(self, day: int, week: Week, cycle: CycleInGrandCycle):
-        self.number = self.verified_day_number(day, week, cycle)
-        self.festival = (week.number == 51)
+        self._number = self.verified_day_number(day, week, cycle)
+        self._festival = (week.number == 51)
+
+    @property
+    def number(self) -> int:
+        """
+        Return the day number (read-only).
+        """
+        return self._number
+
+    @property
+    def festival(self) -> bool:
+        """
+        Return True if the day is a festival day (read-only).
+        """
+        return self._festival
 
     @staticmethod
     def verified_day_number(day: int, week: Week, cycle: CycleInGrandCycle) -> int:
@@ -5,6 +5,9 @@ from npm_calmarendian_date.c_date_config import CDateConfig
 from typing import Tuple, Match
 from math import ceil
 
+_GCN_FULLMATCH = CDateConfig.GCN_DATE_STRING_RE.fullmatch
+_CSN_FULLMATCH = CDateConfig.CSN_DATE_STRING_RE.fullmatch
+
 
 class DateString(object):
     """
@@ -27,14 +30,14 @@ class DateString(object):
         :param date_string: A date string which should conform to either GCN or CSN format rules.
         """
         try:
-            pattern_match = CDateConfig.GCN_DATE_STRING_RE.match(date_string)
+            pattern_match = _GCN_FULLMATCH(date_string)
         except TypeError:
             raise CalmarendianDateError(f"DATE STRING: {date_string.__class__} cannot be parsed as a date string.")
 
         if pattern_match:
             self.gc, self.c, self.s, self.w, self.d = self.parsed_gcn_date(pattern_match)
         else:
-            pattern_match = CDateConfig.CSN_DATE_STRING_RE.match(date_string)
+            pattern_match = _CSN_FULLMATCH(date_string)
             if pattern_match:
                 self.gc, self.c, self.s, self.w, self.d = self.parsed_csn_date(pattern_match)
             else:
@@ -55,7 +58,8 @@ class DateString(object):
         the RegEx for a GCN date string.
         :return: A five-tuple of GCN date elements.
         """
-        return int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4)), int(m.group(5))
+        gc, c, s, w, d = m.groups()
+        return int(gc), int(c), int(s), int(w), int(d)
 
     @staticmethod
     def parsed_csn_date(m: Match) -> NumericGCNSequence:
@@ -70,9 +74,10 @@ class DateString(object):
         the RegEx for a CSN date string.
         :return: A five-tuple of GCN date elements.
         """
-        c = int(m.group(1))
-        if m.group(5):
-            era = m.group(5).upper()
+        c, s, w, d, era = m.groups()
+        c = int(c)
+        if era:
+            era = era.upper()
             if era == "BZ":
                 c = -c
             elif era == "CE" and c < 501:
@@ -83,4 +88,4 @@ class DateString(object):
                 warnings.warn(f"DATE STRING: Cycle 0 Era is BZ, not BH", category=UserWarning, stacklevel=3)
         gc = ceil(c / 700)
         c += 700 * (1 - gc)
-        return gc, c, int(m.group(2)), int(m.group(3)), int(m.group(4))
+        return gc, c, int(s), int(w), int(d)
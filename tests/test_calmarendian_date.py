@@ -1,6 +1,7 @@
 import unittest
 from collections import namedtuple
 
+from npm_calmarendian_date._fastpath import decompose_adr
 from npm_calmarendian_date.calmarendian_date import CalmarendianDate, EraMarker
 from npm_calmarendian_date.date_elements import GrandCycle, CycleInGrandCycle, Season, Week, Day
 from npm_calmarendian_date.exceptions import CalmarendianDateError
@@ -34,6 +35,10 @@ class BasicADRTests(unittest.TestCase):
         d.adr = 1_234_568
         self.assertEqual(1_234_568, d.adr)
         self.assertEqual('Thursday, Week 50 of Onset 503', d.colloquial_date())
+        self.assertEqual('Thursday, Week 50 of Onset 503 CE', d.colloquial_date(era_marker='ce'))
+        d.adr = 0
+        self.assertEqual('Festival 8 of 0 BZ', d.colloquial_date())
+        self.assertEqual('Festival Eight of 0 Before Time Zero', d.colloquial_date(verbose=True, era_marker='bh'))
 
     def test_cycle_decode(self):
         items = [
@@ -49,6 +54,24 @@ class BasicADRTests(unittest.TestCase):
         for item in items:
             self.assertEqual(item["cycle"], CalmarendianDate.cycle_decode(item["days"]))
 
+    def test_cycle_decode_every_cycle(self):
+        # cycle_decode is monotonic, so matching the first and last day of every cycle proves it exact
+        # for every day of the grand cycle.
+        for c in range(1, 701):
+            first_day = CycleInGrandCycle(c).days_prior() + 1
+            last_day = CycleInGrandCycle(c + 1).days_prior() if c < 700 else CDateConfig.DAYS_per_GRAND_CYCLE
+            with self.subTest(cycle=c):
+                self.assertEqual(c, CalmarendianDate.cycle_decode(first_day))
+                self.assertEqual(c, CalmarendianDate.cycle_decode(last_day))
+
+    def test_days_prior_tables(self):
+        for c in range(1, 701):
+            self.assertEqual(CycleInGrandCycle(c).days_prior(), CDateConfig.CYCLE_DAYS_PRIOR[c - 1])
+        for s in range(1, 8):
+            self.assertEqual(Season(s).days_prior(), CDateConfig.SEASON_DAYS_PRIOR[s - 1])
+        for w in range(1, 52):
+            self.assertEqual(Week(w, Season(7)).days_prior(), CDateConfig.WEEK_DAYS_PRIOR[w - 1])
+
     def test_basic_setting(self):
         data = [
             -5000,
@@ -61,6 +84,12 @@ class BasicADRTests(unittest.TestCase):
                 d = CalmarendianDate(item)
                 self.assertEqual(item, d.adr)
 
+    def test_no_instance_dict(self):
+        d = CalmarendianDate(1)
+        self.assertFalse(hasattr(d, '__dict__'))
+        with self.assertRaises(AttributeError):
+            d.not_a_date_attribute = 1
+
     def test_elemental_adr_set(self):
         items = [
             {"input": -1_718_100, "result": self.ResultSet(0, 1, 1, 1, 1)},
@@ -82,6 +111,32 @@ class BasicADRTests(unittest.TestCase):
                 self.assertEqual(r.s, d.season.number)
                 self.assertEqual(r.w, d.week.number)
                 self.assertEqual(r.d, d.day.number)
+                self.assertEqual(tuple(r), decompose_adr(item["input"]))
+
+    def test_shared_elements(self):
+        d1 = CalmarendianDate(1_905_361)
+        d2 = CalmarendianDate.from_date_string('01-077-3-04-5')
+        self.assertIs(d1.cycle, d2.cycle)
+        self.assertIs(d1.season, d2.season)
+        self.assertIs(d1.week, d2.week)
+        self.assertIs(d1.day, d2.day)
+        self.assertIsNot(d1.grand_cycle, d2.grand_cycle)
+        self.assertIs(d2.week.season, d2.season)
+
+    def test_shared_elements_cannot_be_changed(self):
+        d = CalmarendianDate(5)
+        with self.assertRaises(AttributeError):
+            d.day.number = 3
+        self.assertEqual('01-001-1-02-5', CalmarendianDate(12).gcn())
+
+    def test_decompose_many(self):
+        adrs = [-1_718_100, 0, 1, 1_906_784, 170_091_999]
+        expected = [CalmarendianDate(adr).grand_cycle_notation() for adr in adrs]
+        result = ["{:>02}-{:>03}-{}-{:>02}-{}".format(*e) for e in CalmarendianDate.decompose_many(adrs)]
+        self.assertEqual(expected, result)
+        self.assertEqual([], CalmarendianDate.decompose_many([]))
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianDate.decompose_many([1, 200_000_000])
 
     def test_output_gcn(self):
         items = [
@@ -127,6 +182,14 @@ class BasicADRTests(unittest.TestCase):
             d = CalmarendianDate(item["input"])
             self.assertTupleEqual(item["result"], d.absolute_cycle_ref())
 
+    def test_abs_cycle_ref_follows_adr(self):
+        d = CalmarendianDate(1)
+        self.assertTupleEqual((1, EraMarker.BH), d.absolute_cycle_ref())
+        d.adr = 0
+        self.assertTupleEqual((0, EraMarker.BZ), d.absolute_cycle_ref())
+        d.apocalypse_reckoning = 1
+        self.assertTupleEqual((777, EraMarker.CE), d.absolute_cycle_ref())
+
     def test_abs_season_ref(self):
         data = [
             {"input": CDateConfig.MIN_ADR, "result": -4899},
@@ -228,6 +291,19 @@ class CreateFromFactoriesTests(unittest.TestCase):
             self.assertEqual(item["result"]["gcn"], d.gcn())
             self.assertEqual(item["result"]["adr"], d.adr)
 
+    def test_create_from_int_like_numbers(self):
+        data = [
+            {"input": (1, 1, 1, 1, 1.0), "result": {"gcn": "01-001-1-01-1", "adr": 1}},
+            {"input": (1.0, 423.0, 1.0, 23.0, 4.0), "result": {"gcn": "01-423-1-23-4", "adr": 1_035_926}},
+            {"input": (True, 1, 1, 1, True), "result": {"gcn": "01-001-1-01-1", "adr": 1}},
+        ]
+        for item in data:
+            with self.subTest(i=item["input"]):
+                d = CalmarendianDate.from_numbers(*item["input"])
+                self.assertIs(int, type(d.adr))
+                self.assertEqual(item["result"]["gcn"], d.gcn())
+                self.assertEqual(item["result"]["adr"], d.adr)
+
     def test_create_from_gcn(self):
         data = [
             {"date_string": '00-001-1-01-1', "result": CDateConfig.MIN_ADR},
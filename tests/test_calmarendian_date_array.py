@@ -0,0 +1,57 @@
+import unittest
+from array import array
+
+from npm_calmarendian_date import CalmarendianDate, CalmarendianDateArray
+from npm_calmarendian_date.c_date_config import CDateConfig
+from npm_calmarendian_date.exceptions import CalmarendianDateError
+
+
+class CalmarendianDateArrayTests(unittest.TestCase):
+    def setUp(self):
+        self.adrs = [1_906_904, CDateConfig.MIN_ADR, 0, CDateConfig.MAX_ADR, 1_035_926]
+        self.dates = CalmarendianDateArray(self.adrs)
+
+    def test_bad_inputs(self):
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianDateArray([1, "Random String"])
+        with self.assertRaises(CalmarendianDateError):
+            CalmarendianDateArray([1, 200_000_000])
+
+    def test_sequence_protocol(self):
+        self.assertEqual(5, len(self.dates))
+        self.assertEqual(0, len(CalmarendianDateArray()))
+        self.assertEqual(CalmarendianDate(1_906_904), self.dates[0])
+        self.assertEqual(CalmarendianDate(1_035_926), self.dates[-1])
+        self.assertEqual([CalmarendianDate(adr) for adr in self.adrs], list(self.dates))
+        self.assertEqual(CalmarendianDateArray([0, CDateConfig.MAX_ADR]), self.dates[2:4])
+        self.assertIn(CalmarendianDate(0), self.dates)
+        self.assertNotIn(CalmarendianDate(1), self.dates)
+        self.assertNotIn(0, self.dates)
+
+    def test_from_dates(self):
+        self.assertEqual(self.dates, CalmarendianDateArray.from_dates(CalmarendianDate(adr) for adr in self.adrs))
+
+    def test_adrs_copy(self):
+        adrs = self.dates.adrs
+        self.assertEqual(array('q', self.adrs), adrs)
+        adrs[0] = 1
+        self.assertEqual(CalmarendianDate(1_906_904), self.dates[0])
+
+    def test_min_max_sorted(self):
+        self.assertEqual(CalmarendianDate(CDateConfig.MIN_ADR), self.dates.min())
+        self.assertEqual(CalmarendianDate(CDateConfig.MAX_ADR), self.dates.max())
+        self.assertEqual(CalmarendianDateArray(sorted(self.adrs)), self.dates.sorted())
+        self.assertEqual(CalmarendianDateArray(sorted(self.adrs, reverse=True)), self.dates.sorted(reverse=True))
+        with self.assertRaises(ValueError):
+            CalmarendianDateArray().min()
+
+    def test_decompose(self):
+        self.assertEqual(CalmarendianDate.decompose_many(self.adrs), self.dates.decompose())
+        self.assertEqual((2, 77, 7, 25, 1), self.dates.decompose()[0])
+
+    def test_repr(self):
+        self.assertEqual("CalmarendianDateArray([0, 1])", repr(CalmarendianDateArray([0, 1])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -37,6 +37,22 @@ class MyTestCase(unittest.TestCase):
         self.assertTrue(self.today >= self.election_day)
         self.assertFalse(self.today >= self.tomorrow)
 
+    def test_ne(self):
+        self.assertTrue(self.today != self.yesterday)
+        self.assertFalse(self.today != self.election_day)
+
+    def test_non_date_comparison(self):
+        self.assertFalse(self.today == 1_906_904)
+        self.assertTrue(self.today != 1_906_904)
+        with self.assertRaises(TypeError):
+            _ = self.today < 1_906_905
+
+    def test_hash(self):
+        self.assertEqual(hash(self.today), hash(self.election_day))
+        dates = {self.today, self.yesterday, self.tomorrow, self.election_day}
+        self.assertEqual(3, len(dates))
+        self.assertIn(CalmarendianDate(1_906_904), dates)
+
 
 if __name__ == '__main__':
     unittest.main()
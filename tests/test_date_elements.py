@@ -315,5 +315,27 @@ class WeekendTests(unittest.TestCase):
                 self.assertEqual(item['result'][1], w.weekend.duration)
 
 
+class ImmutabilityTest(unittest.TestCase):
+    def test_elements_are_read_only(self):
+        cycle = CycleInGrandCycle(7)
+        season = Season(7)
+        week = Week(51, season)
+        elements = [
+            (GrandCycle(1), ['number']),
+            (cycle, ['number']),
+            (season, ['number']),
+            (week, ['number', 'season', 'weekend']),
+            (Day(5, week, cycle), ['number', 'festival']),
+        ]
+        for element, attributes in elements:
+            for attribute in attributes:
+                with self.subTest(i=f'{element.__class__.__name__}.{attribute}'):
+                    with self.assertRaises(AttributeError):
+                        setattr(element, attribute, 3)
+            with self.subTest(i=f'{element.__class__.__name__} new attribute'):
+                with self.assertRaises(AttributeError):
+                    element.not_an_element_attribute = 3
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -19,6 +19,9 @@ class GCNStringConversionTests(unittest.TestCase):
         # Out of domain season:
         with self.assertRaisesRegex(CalmarendianDateFormatError, f"DATE STRING: '02-077-8-23-4'"):
             DateString('02-077-8-23-4')
+        # Trailing newline
+        with self.assertRaises(CalmarendianDateFormatError):
+            DateString('02-077-7-07-7\n')
         with self.assertRaisesRegex(CalmarendianDateError, "'list'"):
             arg: Any = []
             DateString(arg)
@@ -56,6 +59,9 @@ class CSNStringConversionTests(unittest.TestCase):
         # An out of domain week number
         with self.assertRaisesRegex(CalmarendianDateFormatError, "DATE STRING: '100-1-63-4'"):
             DateString('100-1-63-4')
+        # Trailing newline
+        with self.assertRaises(CalmarendianDateFormatError):
+            DateString('777-7-07-7 CE\n')
 
     def test_dubious_era_markers(self):
         with self.assertWarns(UserWarning) as my_warning: